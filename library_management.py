@@ -6,13 +6,16 @@ A terminal-based library management system using Object-Oriented Programming.
 Demonstrates:
     - Abstract base classes and abstract methods
     - Inheritance and method overriding (polymorphism)
-    - Encapsulation via private attributes with property accessors
+    - Encapsulation via read-only __slots__ attributes
     - Error handling throughout user interaction
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from functools import lru_cache
 import os
 import sys
+from typing import Optional
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +44,7 @@ class Style:
     HIDE_CURSOR = "\033[?25l"
     SHOW_CURSOR = "\033[?25h"
     CLEAR_LINE  = "\033[2K"
+    CLEAR_EOL   = "\033[K"
 
     @staticmethod
     def c(text: str, *codes: str) -> str:
@@ -52,12 +56,170 @@ class Style:
         """ANSI code to move cursor up *n* lines."""
         return f"\033[{n}A" if n else ""
 
+    @staticmethod
+    def move_down(n: int = 1) -> str:
+        """ANSI code to move cursor down *n* lines."""
+        return f"\033[{n}B" if n else ""
+
+
+# Pre-joined code pairs for hot paths; Style.c stays for one-off messages
+_BOLD_CYAN    = Style.BOLD + Style.CYAN
+_BOLD_GREEN   = Style.BOLD + Style.GREEN
+_BOLD_MAGENTA = Style.BOLD + Style.MAGENTA
+
+
+# ---------------------------------------------------------------------------
+# Output helpers
+# ---------------------------------------------------------------------------
+def _write_block(text: str) -> None:
+    """Write a large block of *text* to stdout in one encoded chunk.
+
+    Bypasses the line-buffered text layer (one flush per newline on a TTY)
+    by encoding once and writing to the underlying binary buffer. Falls
+    back to a plain write when stdout has no binary buffer.
+    """
+    out = sys.stdout
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        out.write(text)
+        out.flush()
+        return
+    out.flush()                                  # keep earlier text in order
+    raw.write(text.encode(out.encoding or "utf-8", out.errors or "strict"))
+    raw.flush()
+
+
+def _write_frame(frame: str) -> None:
+    """Write a redraw *frame* straight to stdout's file descriptor.
+
+    Skips the text layer's lock and flush for keystroke redraws, encoding
+    with stdout's own encoding and error policy as :func:`_write_block`
+    does. Callers must flush ``sys.stdout`` before the first frame.
+    Windows consoles (whose code page may differ from that encoding) and
+    streams without a descriptor go through ``sys.stdout`` instead.
+    """
+    out = sys.stdout
+    if os.name != "nt":
+        try:
+            fd = out.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is not None:
+            encoded = frame.encode(out.encoding or "utf-8", out.errors or "strict")
+            data = memoryview(encoded)
+            while data:
+                data = data[os.write(fd, data):]
+            return
+    out.write(frame)
+    out.flush()
+
+
+# ---------------------------------------------------------------------------
+# ANSI-aware text measuring helpers
+# ---------------------------------------------------------------------------
+def _visible_len(text: str) -> int:
+    """Return the length of *text* ignoring ANSI escape sequences.
+
+    Counts visible characters in a single scan, skipping from each
+    ``ESC [`` to the terminating ``m`` without building a stripped copy.
+    """
+    count = 0
+    pos = 0
+    end = len(text)
+    while True:
+        esc = text.find("\x1b[", pos)
+        if esc < 0:
+            return count + end - pos
+        count += esc - pos
+        term = text.find("m", esc + 2)
+        if term < 0:
+            return count
+        pos = term + 1
+
+
+@lru_cache(maxsize=32)
+def _table_separator(widths: tuple[int, ...]) -> str:
+    """Return the dimmed horizontal rule for columns of *widths*."""
+    return Style.DIM + "─" + "─┬─".join("─" * w for w in widths) + "─" + Style.RESET
+
+
+def _measured(text: str) -> tuple[str, int]:
+    """Pair *text* with its visible length so it is only scanned once."""
+    return text, _visible_len(text)
+
+
+_SPACES = " " * 512
+
+
+def _pad(cell: tuple[str, int], width: int) -> str:
+    """Pad a :func:`_measured` cell to *width* visible characters."""
+    text, visible = cell
+    gap = width - visible
+    if gap <= 0:
+        return text
+    if gap > len(_SPACES):                      # wider than the cached run
+        return text + " " * gap
+    return text + _SPACES[:gap]
+
 
 # ---------------------------------------------------------------------------
 # Arrow-key menu selector (cross-platform, no external dependencies)
 # ---------------------------------------------------------------------------
-def _read_key() -> str:
-    """Read a single keypress from stdin (raw mode).
+def _setup_raw() -> Optional[list]:
+    """Switch the terminal into raw mode and return the previous settings.
+
+    Output post-processing is kept on so a newline still returns the carriage.
+    On Windows this is a no-op and returns None.
+    """
+    if os.name == "nt":
+        return None
+    import tty
+    import termios
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    tty.setraw(fd)
+    mode = termios.tcgetattr(fd)
+    mode[1] |= termios.OPOST                     # oflag
+    termios.tcsetattr(fd, termios.TCSANOW, mode)
+    return old
+
+
+def _restore(old: Optional[list]) -> None:
+    """Restore terminal settings saved by :func:`_setup_raw`."""
+    if old is None:
+        return
+    import termios
+    termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, old)
+
+
+# Bytes read from stdin on POSIX but not yet turned into keys. A single
+# os.read can return several queued keys (key-repeat, fast typing) or stop
+# part-way through an escape sequence, so keys are parsed from this queue.
+_pending = bytearray()
+
+
+def _fill(fd: int, size: int) -> bool:
+    """Read from *fd* until at least *size* bytes are pending.
+
+    Returns False if end of input is reached first.
+    """
+    while len(_pending) < size:
+        data = os.read(fd, 8)
+        if not data:
+            return False
+        _pending.extend(data)
+    return True
+
+
+def _take(size: int) -> bytes:
+    """Remove and return the first *size* pending bytes."""
+    data = bytes(_pending[:size])
+    del _pending[:size]
+    return data
+
+
+def _read_key_raw() -> str:
+    """Read a single keypress from stdin, which must already be in raw mode.
 
     Works on Windows (msvcrt) and Unix/macOS (tty + termios).
     Returns 'up', 'down', 'enter', or the character pressed.
@@ -76,25 +238,38 @@ def _read_key() -> str:
             return "special"
         return ch.decode("utf-8", errors="replace")
     else:                                        # ---- Unix / macOS ----
-        import tty
-        import termios
         fd = sys.stdin.fileno()
-        old = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            if ch in ("\r", "\n"):
-                return "enter"
-            if ch == "\x1b":                     # escape sequence
-                seq = sys.stdin.read(2)
-                if seq == "[A":
-                    return "up"
-                if seq == "[B":
-                    return "down"
+        if not _fill(fd, 1):
+            return ""
+        lead = _pending[0]
+        if lead in b"\r\n":
+            _take(1)
+            return "enter"
+        if lead == 0x1b:                         # escape sequence
+            if not _fill(fd, 2) or _pending[1] != ord("["):
+                _take(1)
                 return "esc"
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+            # CSI: parameter/intermediate bytes up to a final byte in @..~
+            end = 2
+            while True:
+                if not _fill(fd, end + 1):
+                    _pending.clear()
+                    return "esc"
+                if 0x40 <= _pending[end] <= 0x7e:
+                    break
+                end += 1
+            seq = _take(end + 1)
+            if seq == b"\x1b[A":
+                return "up"
+            if seq == b"\x1b[B":
+                return "down"
+            return "esc"
+        # One UTF-8 character: lead byte plus its continuation bytes
+        size = 1 if lead < 0xc0 else 2 if lead < 0xe0 else 3 if lead < 0xf0 else 4
+        n = 1
+        while n < size and _fill(fd, n + 1) and 0x80 <= _pending[n] < 0xc0:
+            n += 1
+        return _take(n).decode("utf-8", errors="replace")
 
 
 def arrow_menu(title: str, options: list[str]) -> int:
@@ -105,36 +280,58 @@ def arrow_menu(title: str, options: list[str]) -> int:
     selected = 0
     count = len(options)
 
-    def _draw(first_draw: bool = False) -> None:
-        """Render all menu options, highlighting the selected one."""
-        if not first_draw:
-            # Move cursor back up to overwrite previous render
-            sys.stdout.write(Style.move_up(count))
-        for i, opt in enumerate(options):
-            sys.stdout.write(Style.CLEAR_LINE)
-            if i == selected:
-                line = Style.c(f"  ▸ {opt}", Style.BOLD, Style.CYAN)
-            else:
-                line = Style.DIM + f"    {opt}" + Style.RESET
-            sys.stdout.write(line + "\n")
-        sys.stdout.flush()
+    # Both renderings of every option are fixed for the menu's lifetime.
+    # Each overwrites its row in place and erases any leftover tail.
+    eol = Style.CLEAR_EOL + "\n"
+    dim_lines = [Style.DIM + f"    {opt}" + Style.RESET + eol for opt in options]
+    sel_lines = [_BOLD_CYAN + f"  ▸ {opt}" + Style.RESET + eol for opt in options]
+
+    def _line(i: int) -> str:
+        """Return the rendered text of option *i*."""
+        return sel_lines[i] if i == selected else dim_lines[i]
+
+    def _draw(prev: Optional[int] = None) -> None:
+        """Render the menu, highlighting the selected option.
+
+        With *prev* given only the previously and newly selected rows are
+        repainted; otherwise every option is drawn.
+        """
+        if prev is None:
+            buf = [_line(i) for i in range(count)]
+        else:
+            # Cursor rests below the last option; hop to each changed row,
+            # repaint it and return to the bottom.
+            buf = []
+            for i in (prev, selected):
+                buf.append(Style.move_up(count - i))
+                buf.append(_line(i))
+                buf.append(Style.move_down(count - i - 1))
+        # Emit the whole frame in one write
+        _write_frame("".join(buf))
 
     # Print title and initial draw
     print(title)
     sys.stdout.write(Style.HIDE_CURSOR)
-    _draw(first_draw=True)
+    sys.stdout.flush()
+    _draw()
 
+    # Enter raw mode once for the whole menu rather than per keypress
+    old = None
     try:
+        old = _setup_raw()
         while True:
-            key = _read_key()
+            key = _read_key_raw()
+            prev = selected
             if key == "up":
                 selected = (selected - 1) % count
             elif key == "down":
                 selected = (selected + 1) % count
             elif key == "enter":
                 break
-            _draw()
+            if selected != prev:
+                _draw(prev)
     finally:
+        _restore(old)
         sys.stdout.write(Style.SHOW_CURSOR)
         sys.stdout.flush()
 
@@ -147,31 +344,36 @@ def arrow_menu(title: str, options: list[str]) -> int:
 class Book(ABC):
     """Abstract base class representing a generic book.
 
-    Attributes are kept private and exposed through read-only properties
-    to enforce encapsulation.
+    Attributes are declared in ``__slots__`` so every book has a fixed
+    layout and no per-instance ``__dict__``; they are read directly.
+    Attributes are assigned in ``__init__`` through ``object.__setattr__``
+    and every later write is rejected, which keeps books read-only and
+    makes the values derived from them safe to cache.
     """
 
-    def __init__(self, title: str, author: str, year: int) -> None:
-        self.__title = title
-        self.__author = author
-        self.__year = year
-
-    # --- read-only properties (encapsulation) ---
-
-    @property
-    def title(self) -> str:
-        """Return the book title."""
-        return self.__title
+    __slots__ = ("title", "author", "year", "_title_lower")
 
-    @property
-    def author(self) -> str:
-        """Return the book author."""
-        return self.__author
+    def __init__(self, title: str, author: str, year: int) -> None:
+        _set = object.__setattr__                # bypasses the guard below
+        _set(self, "title", title)
+        _set(self, "author", author)
+        _set(self, "year", year)
+        # Lower-cased once here so searches never re-lower every title
+        _set(self, "_title_lower", title.lower())
+
+    # --- read-only attributes (encapsulation) ---
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject writes; attributes are only set inside ``__init__``."""
+        raise AttributeError(
+            f"{type(self).__name__}.{name} is read-only once the book is created"
+        )
 
-    @property
-    def year(self) -> int:
-        """Return the publication year."""
-        return self.__year
+    def __delattr__(self, name: str) -> None:
+        """Reject deletes, which would let an attribute be set again."""
+        raise AttributeError(
+            f"{type(self).__name__}.{name} is read-only once the book is created"
+        )
 
     @abstractmethod
     def display_info(self) -> str:
@@ -198,61 +400,69 @@ class Book(ABC):
 class EBook(Book):
     """An electronic book with an associated file size."""
 
+    __slots__ = ("file_size_mb", "_extra", "_display")
+
+    _LABEL = Style.c(" EBook ", Style.BOLD, Style.CYAN)
+
     def __init__(
         self, title: str, author: str, year: int, file_size_mb: float
     ) -> None:
         super().__init__(title, author, year)
-        self.__file_size_mb = file_size_mb
-
-    @property
-    def file_size_mb(self) -> float:
-        """Return the file size in megabytes."""
-        return self.__file_size_mb
+        _set = object.__setattr__                # see Book.__setattr__
+        _set(self, "file_size_mb", file_size_mb)
+        # Books are read-only after __init__, so render once here
+        extra = f"{file_size_mb} MB"
+        _set(self, "_extra", extra)
+        _set(self, "_display", (
+            f"{self._LABEL}  Title: {title} | "
+            f"Author: {author} | Year: {year} | "
+            f"Size: {extra}"
+        ))
 
     def book_type_label(self) -> str:
         """Return a coloured type tag."""
-        return Style.c(" EBook ", Style.BOLD, Style.CYAN)
+        return self._LABEL
 
     def extra_detail(self) -> str:
         """Return the type-specific detail string."""
-        return f"{self.file_size_mb} MB"
+        return self._extra
 
     def display_info(self) -> str:
-        return (
-            f"{self.book_type_label()}  Title: {self.title} | "
-            f"Author: {self.author} | Year: {self.year} | "
-            f"Size: {self.extra_detail()}"
-        )
+        return self._display
 
 
 class PrintedBook(Book):
     """A physical printed book with a page count."""
 
+    __slots__ = ("number_of_pages", "_extra", "_display")
+
+    _LABEL = Style.c(" Print ", Style.BOLD, Style.YELLOW)
+
     def __init__(
         self, title: str, author: str, year: int, number_of_pages: int
     ) -> None:
         super().__init__(title, author, year)
-        self.__number_of_pages = number_of_pages
-
-    @property
-    def number_of_pages(self) -> int:
-        """Return the number of pages."""
-        return self.__number_of_pages
+        _set = object.__setattr__                # see Book.__setattr__
+        _set(self, "number_of_pages", number_of_pages)
+        # Books are read-only after __init__, so render once here
+        extra = f"{number_of_pages} pp"
+        _set(self, "_extra", extra)
+        _set(self, "_display", (
+            f"{self._LABEL}  Title: {title} | "
+            f"Author: {author} | Year: {year} | "
+            f"Pages: {extra}"
+        ))
 
     def book_type_label(self) -> str:
         """Return a coloured type tag."""
-        return Style.c(" Print ", Style.BOLD, Style.YELLOW)
+        return self._LABEL
 
     def extra_detail(self) -> str:
         """Return the type-specific detail string."""
-        return f"{self.number_of_pages} pp"
+        return self._extra
 
     def display_info(self) -> str:
-        return (
-            f"{self.book_type_label()}  Title: {self.title} | "
-            f"Author: {self.author} | Year: {self.year} | "
-            f"Pages: {self.extra_detail()}"
-        )
+        return self._display
 
 
 # ---------------------------------------------------------------------------
@@ -262,14 +472,37 @@ class Library:
     """Manages a list of Book objects.
 
     Provides methods to add books, display all books, and search by title.
+    Alongside the Book objects, the fields used for searching and table
+    display are kept in index-aligned column lists so those loops walk
+    plain lists instead of calling into every book.
     """
 
+    # Separates titles in the packed search index (see _packed_titles)
+    _TITLE_SEP = "\0"
+
     def __init__(self) -> None:
         self.__books: list[Book] = []
+        # Column lists, kept index-aligned with __books
+        self._titles: list[str] = []
+        self._authors: list[str] = []
+        self._years: list[int] = []
+        self._labels: list[str] = []
+        self._details: list[str] = []
+        self._titles_lower: list[str] = []
+        # Packed search index, rebuilt lazily after the collection changes
+        self._title_index: Optional[str] = None
+        self._title_offsets: list[int] = []
 
     def add_book(self, book: Book) -> None:
         """Add a book to the library collection."""
         self.__books.append(book)
+        self._titles.append(book.title)
+        self._authors.append(book.author)
+        self._years.append(book.year)
+        self._labels.append(book.book_type_label())
+        self._details.append(book.extra_detail())
+        self._titles_lower.append(book._title_lower)
+        self._title_index = None
 
     def list_books(self) -> list[Book]:
         """Return a shallow copy of all books in the library."""
@@ -280,36 +513,35 @@ class Library:
 
         Raises IndexError if the index is out of range.
         """
-        return self.__books.pop(index)
+        book = self.__books.pop(index)
+        for column in (
+            self._titles, self._authors, self._years,
+            self._labels, self._details, self._titles_lower,
+        ):
+            del column[index]
+        self._title_index = None
+        return book
 
     # ---- table formatting helpers ----
 
-    @staticmethod
-    def _visible_len(text: str) -> int:
-        """Return the length of *text* ignoring ANSI escape sequences."""
-        import re
-        return len(re.sub(r"\033\[[0-9;]*m", "", text))
-
-    @staticmethod
-    def _pad(text: str, width: int) -> str:
-        """Pad *text* to *width* visible characters (ANSI-aware)."""
-        import re
-        visible = len(re.sub(r"\033\[[0-9;]*m", "", text))
-        return text + " " * max(0, width - visible)
-
-    def _print_table(self, books: list["Book"]) -> None:
-        """Print *books* in a neat, coloured table."""
-        # Build rows: (#, Type, Title, Author, Year, Extra)
-        rows: list[tuple[str, str, str, str, str, str]] = []
-        for i, book in enumerate(books, start=1):
-            rows.append((
-                str(i),
-                book.book_type_label(),
-                book.title,
-                book.author,
-                str(book.year),
-                book.extra_detail(),
-            ))
+    def _print_table(self, indices: Optional[list[int]] = None) -> None:
+        """Print the books at *indices* (default: all) in a coloured table."""
+        columns = (
+            self._labels, self._titles, self._authors,
+            self._years, self._details,
+        )
+        if indices is None:
+            records = zip(*columns)
+        else:
+            records = (tuple(col[i] for col in columns) for i in indices)
+
+        # Build rows: (#, Type, Title, Author, Year, Extra), each cell
+        # measured once as (text, visible_len)
+        rows: list[tuple[tuple[str, int], ...]] = []
+        for n, (label, title, author, year, detail) in enumerate(records, start=1):
+            rows.append(tuple(_measured(cell) for cell in (
+                str(n), label, title, author, str(year), detail,
+            )))
 
         # Column headers
         headers = ("#", "Type", "Title", "Author", "Year", "Detail")
@@ -317,58 +549,113 @@ class Library:
         # Compute column widths (max of header vs data, ANSI-aware)
         widths = [len(h) for h in headers]
         for row in rows:
-            for col, cell in enumerate(row):
-                widths[col] = max(widths[col], self._visible_len(cell))
+            for col, (_, visible) in enumerate(row):
+                if visible > widths[col]:
+                    widths[col] = visible
 
-        # Separator line
-        sep = Style.DIM + "─" + "─┬─".join("─" * w for w in widths) + "─" + Style.RESET
+        # Separator line (shared across displays with the same widths)
+        sep = _table_separator(tuple(widths))
 
         # Header row
         hdr_cells = [
-            Style.c(h.ljust(widths[ci]), Style.BOLD, Style.GREEN)
+            _BOLD_GREEN + h.ljust(widths[ci]) + Style.RESET
             for ci, h in enumerate(headers)
         ]
         hdr_line = " " + " │ ".join(hdr_cells) + " "
 
-        print()
-        print(Style.c(" 📚  Library Collection ", Style.BOLD, Style.MAGENTA))
-        print(sep)
-        print(hdr_line)
-        print(sep)
+        # Accumulate the whole table and emit it with a single write
+        buf: list[str] = [
+            "",
+            _BOLD_MAGENTA + " 📚  Library Collection " + Style.RESET,
+            sep,
+            hdr_line,
+            sep,
+        ]
 
         # Data rows
         for row in rows:
-            cells = [self._pad(cell, widths[ci]) for ci, cell in enumerate(row)]
-            print(" " + " │ ".join(cells) + " ")
+            cells = [_pad(cell, widths[ci]) for ci, cell in enumerate(row)]
+            buf.append(" " + " │ ".join(cells) + " ")
 
-        print(sep)
-        print(Style.DIM + f"  {len(books)} book(s) total" + Style.RESET)
-        print()
+        buf.append(sep)
+        buf.append(Style.DIM + f"  {len(rows)} book(s) total" + Style.RESET)
+        buf.append("")
+        _write_block("\n".join(buf) + "\n")
 
     def display_all_books(self) -> None:
         """Print every book using polymorphic display_info() calls."""
         if not self.__books:
             print(Style.c("\n  The library is empty.\n", Style.YELLOW))
             return
-        self._print_table(self.__books)
+        self._print_table()
 
     def search_by_title(self, query: str) -> list[Book]:
         """Return books whose title contains the query (case-insensitive)."""
+        return [self.__books[i] for i in self._find_title(query)]
+
+    # ---- search index helpers ----
+
+    def _find_title(self, query: str) -> list[int]:
+        """Return indices of books whose title contains *query*.
+
+        Matching is case-insensitive and indices come back in collection
+        order.
+        """
         query_lower = query.lower()
-        return [
-            book for book in self.__books
-            if query_lower in book.title.lower()
-        ]
+        if not query_lower or self._TITLE_SEP in query_lower:
+            return [
+                i for i, title_lower in enumerate(self._titles_lower)
+                if query_lower in title_lower
+            ]
+
+        # Scan every title in one C-level str.find pass over the packed index,
+        # mapping each hit back to its book and jumping to the next title.
+        index, offsets = self._packed_titles()
+        matches: list[int] = []
+        pos = index.find(query_lower)
+        while pos >= 0:
+            i = bisect_right(offsets, pos) - 1
+            matches.append(i)
+            if i + 1 == len(offsets):
+                break
+            pos = index.find(query_lower, offsets[i + 1])
+        return matches
+
+    def _packed_titles(self) -> tuple[str, list[int]]:
+        """Return the packed title index and each title's start offset.
+
+        The index is every lower-cased title joined into one string.
+        Titles are separated by a NUL so a query without one can never
+        match across two titles.
+        """
+        if self._title_index is None:
+            offsets: list[int] = []
+            pos = 0
+            for title_lower in self._titles_lower:
+                offsets.append(pos)
+                pos += len(title_lower) + 1
+            self._title_index = self._TITLE_SEP.join(self._titles_lower)
+            self._title_offsets = offsets
+        return self._title_index, self._title_offsets
 
 
 # ---------------------------------------------------------------------------
 # Helper — input validation
 # ---------------------------------------------------------------------------
+def _unsigned(text: str) -> str:
+    """Return *text* without a single leading ``+`` or ``-`` sign."""
+    return text[1:] if text[:1] in ("+", "-") else text
+
+
 def read_int(prompt: str) -> int:
     """Prompt the user until a valid integer is entered."""
     while True:
+        text = input(prompt).strip()
+        # Plain digits convert without ever raising
+        if _unsigned(text).isdecimal():
+            return int(text)
         try:
-            return int(input(prompt))
+            return int(text)                     # rarer forms, e.g. "1_000"
         except ValueError:
             print("  Invalid input. Please enter a whole number.")
 
@@ -376,8 +663,12 @@ def read_int(prompt: str) -> int:
 def read_float(prompt: str) -> float:
     """Prompt the user until a valid float is entered."""
     while True:
+        text = input(prompt).strip()
+        # Plain decimals ("12", "4.5", "-.5") convert without ever raising
+        if _unsigned(text).replace(".", "", 1).isdecimal():
+            return float(text)
         try:
-            return float(input(prompt))
+            return float(text)                   # exponents, inf, nan, ...
         except ValueError:
             print("  Invalid input. Please enter a number.")
 
@@ -421,7 +712,7 @@ def search_menu(library: Library) -> None:
         print(Style.c("  Back to main menu.\n", Style.YELLOW))
         return
 
-    results = library.search_by_title(query)
+    results = library._find_title(query)
     if results:
         library._print_table(results)
     else:
@@ -498,9 +789,6 @@ def main() -> None:
         " 📖  Library Management System ", Style.BOLD, Style.MAGENTA
     )
     line = Style.DIM + "─" * 40 + Style.RESET
-    print(f"\n{line}")
-    print(f"  {banner}")
-    print(f"{line}\n")
 
     if os.name == "nt":
         os_hint = "Windows: use ↑/↓ keys in CMD/PowerShell, then Enter"
@@ -509,9 +797,15 @@ def main() -> None:
     else:
         os_hint = "Use ↑/↓ keys to navigate and Enter to select"
 
-    print(Style.c("  Home usage hint:", Style.BOLD, Style.CYAN))
-    print(Style.DIM + f"  {os_hint}" + Style.RESET)
-    print(Style.DIM + "  Open 'Hints / How it works' for a quick overview.\n" + Style.RESET)
+    _write_block(
+        f"\n{line}\n"
+        f"  {banner}\n"
+        f"{line}\n\n"
+        + Style.c("  Home usage hint:", Style.BOLD, Style.CYAN) + "\n"
+        + Style.DIM + f"  {os_hint}" + Style.RESET + "\n"
+        + Style.DIM + "  Open 'Hints / How it works' for a quick overview.\n"
+        + Style.RESET + "\n"
+    )
 
     menu_options = [
         "📚  Display all books",